@@ -1,4 +1,7 @@
+from typing import Optional
+
 from stubs.mraa_stub import Gpio, DIR_OUT
+from metrics.registry import MetricsRegistry, REGISTRY
 
 
 class LampController:
@@ -12,7 +15,8 @@ class LampController:
     YELLOW = "YELLOW"
     RED = "RED"
     
-    def __init__(self, red_pin: int = 11, green_pin: int = 12, yellow_pin: int = 13):
+    def __init__(self, red_pin: int = 11, green_pin: int = 12, yellow_pin: int = 13,
+                 metrics: Optional[MetricsRegistry] = None):
         """
         Initialize the lamp controller with GPIO pins.
         
@@ -20,7 +24,14 @@ class LampController:
             red_pin (int): GPIO pin for red LED
             green_pin (int): GPIO pin for green LED
             yellow_pin (int): GPIO pin for yellow LED
+            metrics (MetricsRegistry): Registry for instrumentation,
+                defaults to the process-wide registry
         """
+        self.metrics = metrics if metrics is not None else REGISTRY
+        self.metrics.counter("lamp_state_transitions_total", "Lamp state changes by source and target state")
+        self.metrics.counter("gpio_writes_total", "GPIO pin writes by pin and value")
+        self.metrics.histogram("gpio_write_seconds", "Time spent in Gpio.write()")
+        
         self.red_gpio = Gpio(red_pin)
         self.green_gpio = Gpio(green_pin)
         self.yellow_gpio = Gpio(yellow_pin)
@@ -34,11 +45,23 @@ class LampController:
         self._turn_off_all()
         self.current_state = None
     
+    def _write(self, gpio: Gpio, value: int):
+        """
+        Write a value to a GPIO pin, recording metrics if enabled.
+        
+        Args:
+            gpio (Gpio): Pin to write
+            value (int): 0 for LOW, 1 for HIGH
+        """
+        with self.metrics.timer("gpio_write_seconds"):
+            gpio.write(value)
+        self.metrics.inc("gpio_writes_total", pin=gpio.pin, value=value)
+    
     def _turn_off_all(self):
         """Turn off all LEDs."""
-        self.red_gpio.write(0)
-        self.green_gpio.write(0)
-        self.yellow_gpio.write(0)
+        self._write(self.red_gpio, 0)
+        self._write(self.green_gpio, 0)
+        self._write(self.yellow_gpio, 0)
     
     def _set_color(self, color: str):
         """
@@ -50,12 +73,15 @@ class LampController:
         self._turn_off_all()
         
         if color == self.GREEN:
-            self.green_gpio.write(1)
+            self._write(self.green_gpio, 1)
         elif color == self.YELLOW:
-            self.yellow_gpio.write(1)
+            self._write(self.yellow_gpio, 1)
         elif color == self.RED:
-            self.red_gpio.write(1)
+            self._write(self.red_gpio, 1)
         
+        if color != self.current_state:
+            self.metrics.inc("lamp_state_transitions_total",
+                             from_state=self.current_state or "NONE", to_state=color)
         self.current_state = color
         print(f"🔴🟡🟢 Lamp set to {color}")
     
@@ -6,18 +6,53 @@ This is the main simulation for a smart desk lamp that adapts to focus condition
 using simulated sensors (noise, light, heartbeat) and an RGB LED controller.
 """
 
+import argparse
+import cProfile
 import time
+from metrics.registry import REGISTRY
+from metrics.exporter import write_textfile, start_http_server
 from sensors.noise_sensor import NoiseSensor
 from sensors.light_sensor import LightSensor
 from sensors.heartbeat_sensor import HeartbeatSensor
 from controllers.lamp_controller import LampController
 
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command line options.
+    
+    Args:
+        argv (list): Arguments to parse, defaults to sys.argv
+    
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Mental Focus Desk Lamp simulation")
+    parser.add_argument("--metrics-file", metavar="PATH",
+                        help="write Prometheus metrics to PATH after every cycle")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="serve Prometheus metrics on http://<host>:PORT/metrics")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="profile the monitoring loop with cProfile and save stats to PATH")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function to run the Mental Focus Desk Lamp simulation."""
+    args = parse_args(argv)
+    
     print("🔬 Mental Focus Desk Lamp - Starting Simulation")
     print("=" * 50)
     
+    # Metrics are only recorded when something will export them
+    if args.metrics_file or args.metrics_port is not None:
+        REGISTRY.enabled = True
+    REGISTRY.histogram("sensor_read_seconds", "Time spent reading each sensor")
+    REGISTRY.histogram("lamp_update_seconds", "Time spent in LampController.update()")
+    if args.metrics_port is not None:
+        start_http_server(args.metrics_port)
+        print(f"📈 Serving metrics on port {args.metrics_port}")
+    
     # Initialize sensors
     noise_sensor = NoiseSensor()
     light_sensor = LightSensor()
@@ -30,15 +65,22 @@ def main():
     print("📊 Starting sensor monitoring loop...")
     print("Press Ctrl+C to stop\n")
     
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    
     try:
         cycle = 1
         while True:
             print(f"--- Cycle {cycle} ---")
             
             # Read sensor values
-            noise = noise_sensor.read_value()
-            light = light_sensor.read_value()
-            heartbeat = heartbeat_sensor.read_value()
+            with REGISTRY.timer("sensor_read_seconds", sensor="noise"):
+                noise = noise_sensor.read_value()
+            with REGISTRY.timer("sensor_read_seconds", sensor="light"):
+                light = light_sensor.read_value()
+            with REGISTRY.timer("sensor_read_seconds", sensor="heartbeat"):
+                heartbeat = heartbeat_sensor.read_value()
             
             # Display sensor readings
             print(f"🔊 Noise: {noise} dB")
@@ -46,7 +88,8 @@ def main():
             print(f"❤️  Heart Rate: {heartbeat} bpm")
             
             # Update lamp based on sensor readings
-            lamp_controller.update(noise, light, heartbeat)
+            with REGISTRY.timer("lamp_update_seconds"):
+                lamp_controller.update(noise, light, heartbeat)
             
             # Display current lamp state
             current_state = lamp_controller.get_current_state()
@@ -55,6 +98,13 @@ def main():
             
             print()  # Empty line for readability
             
+            # A failed metrics export must not stop the lamp
+            if args.metrics_file:
+                try:
+                    write_textfile(args.metrics_file)
+                except OSError as e:
+                    print(f"⚠️  Could not write metrics to {args.metrics_file}: {e}")
+            
             # Wait before next cycle
             time.sleep(1)
             cycle += 1
@@ -62,6 +112,11 @@ def main():
     except KeyboardInterrupt:
         print("\n🛑 Simulation stopped by user")
         print("👋 Mental Focus Desk Lamp - Goodbye!")
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"⏱️  Profile saved to {args.profile}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from metrics.registry import MetricsRegistry, REGISTRY
+
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def write_textfile(path: str, registry: MetricsRegistry = REGISTRY):
+    """
+    Write the registry to a Prometheus text file.
+
+    The file is written next to its destination and renamed into place, so a
+    collector (e.g. the node_exporter textfile collector) never sees a
+    partially written file.
+
+    Args:
+        path (str): Destination file, conventionally ending in .prom
+        registry (MetricsRegistry): Registry to export
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(registry.render())
+        os.replace(tmp_path, path)
+    except Exception:
+        # Don't leave partial files behind for the collector to pick up
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def start_http_server(port: int, addr: str = "", registry: MetricsRegistry = REGISTRY) -> HTTPServer:
+    """
+    Serve the registry over HTTP at /metrics from a background thread.
+
+    Args:
+        port (int): TCP port to listen on (0 picks a free port)
+        addr (str): Address to bind, all interfaces by default
+        registry (MetricsRegistry): Registry to export
+
+    Returns:
+        HTTPServer: The running server; call shutdown() to stop it
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Keep scrapes out of the simulation output
+            pass
+
+    server = HTTPServer((addr, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
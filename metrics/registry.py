@@ -0,0 +1,334 @@
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+
+# Latency buckets in seconds (upper bounds), from 10 µs up to 250 ms
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    """Turn a label dict into a hashable, sorted key."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value as the Prometheus text format requires."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Format a label key as a Prometheus label set, e.g. {pin="11"}."""
+    pairs = list(key)
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """
+    Monotonically increasing counter, optionally split by labels.
+    """
+
+    def __init__(self, name: str, help_text: str = ""):
+        """
+        Initialize the counter.
+
+        Args:
+            name (str): Metric name
+            help_text (str): Description shown in the exposition output
+        """
+        self.name = name
+        self.help_text = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1, **labels):
+        """
+        Increment the counter.
+
+        Args:
+            amount (int): Amount to add (must not be negative)
+            **labels: Label values identifying the series
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> int:
+        """
+        Get the current value of a series.
+
+        Returns:
+            int: Counter value, 0 if the series has never been incremented
+        """
+        key = _label_key(labels)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def render(self) -> str:
+        """
+        Render the counter in Prometheus text format.
+
+        Returns:
+            str: Exposition lines for this metric
+        """
+        lines = []
+        if self.help_text:
+            lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} counter")
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return "\n".join(lines)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram, optionally split by labels.
+    """
+
+    def __init__(self, name: str, help_text: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Metric name
+            help_text (str): Description shown in the exposition output
+            buckets (Sequence[float]): Increasing bucket upper bounds
+        """
+        if list(buckets) != sorted(buckets):
+            raise ValueError("Histogram buckets must be in increasing order")
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        # Per series: [per-bucket counts..., +Inf count], sum
+        self._counts = {}
+        self._sums = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """
+        Record an observation.
+
+        Args:
+            value (float): Observed value
+            **labels: Label values identifying the series
+        """
+        key = _label_key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += value
+
+    def get_count(self, **labels) -> int:
+        """
+        Get the number of observations in a series.
+
+        Returns:
+            int: Observation count
+        """
+        key = _label_key(labels)
+        with self._lock:
+            return sum(self._counts.get(key, ()))
+
+    def get_sum(self, **labels) -> float:
+        """
+        Get the sum of observations in a series.
+
+        Returns:
+            float: Sum of observed values
+        """
+        key = _label_key(labels)
+        with self._lock:
+            return self._sums.get(key, 0.0)
+
+    def render(self) -> str:
+        """
+        Render the histogram in Prometheus text format (cumulative buckets).
+
+        Returns:
+            str: Exposition lines for this metric
+        """
+        lines = []
+        if self.help_text:
+            lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} histogram")
+        # Copy under the lock so each series' buckets, sum and count agree
+        with self._lock:
+            series = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return "\n".join(lines)
+
+
+class _NullTimer:
+    """Timer that does nothing, used while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """Context manager that observes its elapsed time into a histogram."""
+
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, object]):
+        self._histogram = histogram
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Collection of counters and histograms for the control loop.
+
+    Disabled by default: while disabled, inc() returns immediately and
+    timer() hands back a shared no-op context manager, so instrumented code
+    pays only for a method call and an attribute check.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled (bool): Whether metrics are recorded
+        """
+        self.enabled = enabled
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name (str): Metric name
+            help_text (str): Description used when the counter is created
+
+        Returns:
+            Counter: The registered counter
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Counter(name, help_text)
+        if not isinstance(metric, Counter):
+            raise ValueError(f"Metric {name} is already registered as a {type(metric).__name__}")
+        return metric
+
+    def histogram(self, name: str, help_text: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name (str): Metric name
+            help_text (str): Description used when the histogram is created
+            buckets (Sequence[float]): Bucket bounds used when the histogram is created
+
+        Returns:
+            Histogram: The registered histogram
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = Histogram(name, help_text, buckets)
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"Metric {name} is already registered as a {type(metric).__name__}")
+        return metric
+
+    def inc(self, name: str, amount: int = 1, **labels):
+        """
+        Increment a counter if metrics are enabled.
+
+        Args:
+            name (str): Counter name
+            amount (int): Amount to add
+            **labels: Label values identifying the series
+        """
+        if not self.enabled:
+            return
+        self.counter(name).inc(amount, **labels)
+
+    def timer(self, name: str, **labels):
+        """
+        Time a block of code into a histogram if metrics are enabled.
+
+        Args:
+            name (str): Histogram name
+            **labels: Label values identifying the series
+
+        Returns:
+            A context manager measuring the elapsed time of its block
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self.histogram(name), labels)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text format.
+
+        Returns:
+            str: Full exposition text, newline terminated
+        """
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        if not metrics:
+            return ""
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Process-wide registry used by the controller and main loop
+REGISTRY = MetricsRegistry()
@@ -19,6 +19,8 @@ from test_heartbeat_sensor import TestHeartbeatSensor
 from test_lamp_controller import TestLampController
 from test_mraa_stub import TestMraaStub
 from test_upm_stub import TestUpmStub
+from test_metrics import TestCounter, TestHistogram, TestMetricsRegistry, TestExporter
+from test_main import TestMain
 
 
 def create_test_suite():
@@ -37,6 +39,15 @@ def create_test_suite():
     test_suite.addTest(unittest.makeSuite(TestMraaStub))
     test_suite.addTest(unittest.makeSuite(TestUpmStub))
     
+    # Add metrics tests
+    test_suite.addTest(unittest.makeSuite(TestCounter))
+    test_suite.addTest(unittest.makeSuite(TestHistogram))
+    test_suite.addTest(unittest.makeSuite(TestMetricsRegistry))
+    test_suite.addTest(unittest.makeSuite(TestExporter))
+    
+    # Add main application tests
+    test_suite.addTest(unittest.makeSuite(TestMain))
+    
     return test_suite
 
 
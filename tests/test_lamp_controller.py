@@ -8,6 +8,7 @@ from unittest.mock import patch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from controllers.lamp_controller import LampController
+from metrics.registry import MetricsRegistry
 
 
 class TestLampController(unittest.TestCase):
@@ -86,6 +87,33 @@ class TestLampController(unittest.TestCase):
         self.lamp_controller.update(noise=80, light=400, heartbeat=70)
         self.assertEqual(self.lamp_controller.get_current_state(), "RED")
 
+    
+    def test_metrics_disabled_by_default(self):
+        """Test that the controller records nothing while metrics are off."""
+        registry = MetricsRegistry()
+        lamp_controller = LampController(metrics=registry)
+        lamp_controller.update(noise=30, light=400, heartbeat=70)
+        self.assertEqual(registry.counter("gpio_writes_total").get(pin=12, value=1), 0)
+    
+    def test_metrics_count_transitions_and_writes(self):
+        """Test that state transitions and pin writes are counted."""
+        registry = MetricsRegistry(enabled=True)
+        lamp_controller = LampController(metrics=registry)
+        lamp_controller.update(noise=30, light=400, heartbeat=70)
+        lamp_controller.update(noise=30, light=400, heartbeat=70)
+        lamp_controller.update(noise=80, light=400, heartbeat=70)
+        
+        transitions = registry.counter("lamp_state_transitions_total")
+        self.assertEqual(transitions.get(from_state="NONE", to_state="GREEN"), 1)
+        self.assertEqual(transitions.get(from_state="GREEN", to_state="RED"), 1)
+        self.assertEqual(transitions.get(from_state="GREEN", to_state="GREEN"), 0)
+        
+        writes = registry.counter("gpio_writes_total")
+        self.assertEqual(writes.get(pin=12, value=1), 2)
+        self.assertEqual(writes.get(pin=11, value=1), 1)
+        # 3 writes at init plus 4 per update
+        self.assertEqual(registry.histogram("gpio_write_seconds").get_count(), 15)
+
 
 if __name__ == '__main__':
     unittest.main()
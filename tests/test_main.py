@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+from io import StringIO
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to import project modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from metrics.registry import MetricsRegistry
+
+
+class TestMain(unittest.TestCase):
+    """Test cases for the main simulation loop."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        # Capture stdout to check printed messages
+        self.held, sys.stdout = sys.stdout, StringIO()
+
+    def tearDown(self):
+        """Clean up after each test method."""
+        sys.stdout = self.held
+
+    def test_metrics_write_failure_keeps_loop_running(self):
+        """Test that a failing metrics export does not stop the control loop."""
+        # Stop the loop on the third sleep, i.e. after three full cycles
+        sleep_calls = []
+
+        def fake_sleep(seconds):
+            sleep_calls.append(seconds)
+            if len(sleep_calls) == 3:
+                raise KeyboardInterrupt
+
+        with patch.object(main, "REGISTRY", MetricsRegistry()), \
+                patch.object(main, "write_textfile", side_effect=OSError("No space left on device")) as write, \
+                patch.object(main.time, "sleep", side_effect=fake_sleep):
+            main.main(["--metrics-file", "lamp.prom"])
+
+        self.assertEqual(write.call_count, 3)
+        self.assertEqual(len(sleep_calls), 3)
+        output = sys.stdout.getvalue()
+        self.assertIn("Could not write metrics to lamp.prom: No space left on device", output)
+        self.assertIn("--- Cycle 3 ---", output)
+        self.assertIn("Simulation stopped by user", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import urllib.request
+from unittest.mock import patch
+
+# Add the parent directory to sys.path to import project modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics.registry import MetricsRegistry, Counter, Histogram
+from metrics.exporter import write_textfile, start_http_server
+
+
+class TestCounter(unittest.TestCase):
+    """Test cases for Counter class."""
+
+    def test_counter_increments_per_label_set(self):
+        """Test that each label set is counted separately."""
+        counter = Counter("writes_total")
+        counter.inc(pin=11)
+        counter.inc(2, pin=11)
+        counter.inc(pin=12)
+        self.assertEqual(counter.get(pin=11), 3)
+        self.assertEqual(counter.get(pin=12), 1)
+        self.assertEqual(counter.get(pin=13), 0)
+
+    def test_counter_rejects_negative_amount(self):
+        """Test that counters cannot go down."""
+        with self.assertRaises(ValueError):
+            Counter("writes_total").inc(-1)
+
+    def test_counter_render(self):
+        """Test Prometheus text output of a counter."""
+        counter = Counter("writes_total", "Pin writes")
+        counter.inc(pin=11)
+        self.assertEqual(
+            counter.render(),
+            '# HELP writes_total Pin writes\n'
+            '# TYPE writes_total counter\n'
+            'writes_total{pin="11"} 1'
+        )
+
+    def test_counter_render_escapes_label_values(self):
+        """Test that backslashes, quotes and newlines in label values are escaped."""
+        counter = Counter("events_total")
+        counter.inc(source='C:\\lamp "desk"\nroom')
+        self.assertEqual(
+            counter.render(),
+            '# TYPE events_total counter\n'
+            'events_total{source="C:\\\\lamp \\"desk\\"\\nroom"} 1'
+        )
+
+
+class TestHistogram(unittest.TestCase):
+    """Test cases for Histogram class."""
+
+    def test_observations_fall_into_buckets(self):
+        """Test bucket assignment, count and sum."""
+        histogram = Histogram("latency_seconds", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+        self.assertEqual(histogram.get_count(), 4)
+        self.assertAlmostEqual(histogram.get_sum(), 5.65)
+
+    def test_histogram_render_is_cumulative(self):
+        """Test that rendered buckets are cumulative and end with +Inf."""
+        histogram = Histogram("latency_seconds", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+        output = histogram.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', output)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 2', output)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', output)
+        self.assertIn('latency_seconds_sum 5.55', output)
+        self.assertIn('latency_seconds_count 3', output)
+
+    def test_histogram_rejects_unsorted_buckets(self):
+        """Test that bucket bounds must be increasing."""
+        with self.assertRaises(ValueError):
+            Histogram("latency_seconds", buckets=(1.0, 0.1))
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for MetricsRegistry class."""
+
+    def test_registry_disabled_by_default(self):
+        """Test that a disabled registry records nothing."""
+        registry = MetricsRegistry()
+        self.assertFalse(registry.enabled)
+        registry.inc("writes_total")
+        with registry.timer("latency_seconds"):
+            pass
+        self.assertEqual(registry.render(), "")
+
+    def test_enabled_registry_records(self):
+        """Test that an enabled registry records counters and timings."""
+        registry = MetricsRegistry(enabled=True)
+        registry.inc("writes_total", pin=11)
+        with registry.timer("latency_seconds", sensor="noise"):
+            pass
+        self.assertEqual(registry.counter("writes_total").get(pin=11), 1)
+        self.assertEqual(registry.histogram("latency_seconds").get_count(sensor="noise"), 1)
+
+    def test_name_reused_with_other_type(self):
+        """Test that a name cannot be registered as two metric types."""
+        registry = MetricsRegistry()
+        registry.counter("writes_total")
+        with self.assertRaises(ValueError):
+            registry.histogram("writes_total")
+
+    def test_render_while_observing(self):
+        """Test that rendering from another thread sees consistent series."""
+        registry = MetricsRegistry(enabled=True)
+        histogram = registry.histogram("latency_seconds", buckets=(0.5, 2.0))
+        stop = threading.Event()
+
+        def observe():
+            # New series keep appearing, each observation adds exactly 1.0
+            series = 0
+            while not stop.is_set():
+                series += 1
+                for _ in range(5):
+                    histogram.observe(1.0, series=series % 200)
+                    registry.inc("writes_total", pin=series % 200)
+
+        writer = threading.Thread(target=observe)
+        writer.start()
+        try:
+            for _ in range(200):
+                samples = {}
+                for line in registry.render().splitlines():
+                    if line.startswith("latency_seconds_sum") or line.startswith("latency_seconds_count"):
+                        name, value = line.rsplit(" ", 1)
+                        samples[name] = float(value)
+                for name, value in samples.items():
+                    if name.startswith("latency_seconds_sum"):
+                        count_name = name.replace("_sum", "_count", 1)
+                        self.assertEqual(value, samples[count_name])
+        finally:
+            stop.set()
+            writer.join()
+
+
+class TestExporter(unittest.TestCase):
+    """Test cases for Prometheus exporters."""
+
+    def setUp(self):
+        """Set up a registry with one recorded value."""
+        self.registry = MetricsRegistry(enabled=True)
+        self.registry.inc("writes_total", pin=11)
+
+    def test_write_textfile(self):
+        """Test that the text file contains the rendered registry."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "lamp.prom")
+            write_textfile(path, self.registry)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), self.registry.render())
+            self.assertEqual(os.listdir(tmp_dir), ["lamp.prom"])
+
+    def test_write_textfile_failure_removes_temp_file(self):
+        """Test that a failed write leaves no temporary file behind."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "lamp.prom")
+            with patch.object(self.registry, "render", side_effect=OSError("No space left on device")):
+                with self.assertRaises(OSError):
+                    write_textfile(path, self.registry)
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+    def test_http_server(self):
+        """Test that /metrics serves the rendered registry."""
+        server = start_http_server(0, "127.0.0.1", self.registry)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/metrics"
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode("utf-8")
+            self.assertIn('writes_total{pin="11"} 1', body)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    unittest.main()